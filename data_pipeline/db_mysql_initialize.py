@@ -131,13 +131,17 @@ def initialize_db():
 
 def initialize_tables(conn):
     """
-    Creates the CROSSWORD_CLUES table within the database.
+    Creates the CROSSWORD_CLUES table and its summary tables within the database.
     Table schema:
     - id: Auto-incrementing primary key for unique identification
     - clue: Full text of the crossword clue (TEXT allows long content)
     - answer: The solution word/phrase (VARCHAR limited to 255 chars)
     - definition: The hint or definition part of the clue (TEXT)
 
+    Summary tables (see db_summary_mysql.py):
+    - ANSWER_STATS: clue count, length and first/last seen id per answer
+    - DEFINITION_ANSWERS: normalized definition -> answer with frequency
+
     Args:
         conn: Active MySQL connection to the CROSSWORD_DB database
     """
@@ -156,6 +160,34 @@ def initialize_tables(conn):
         )'''
 
     cursor.execute(create_table_query)
+
+    # Per-answer summary, maintained incrementally by update_summary_tables()
+    # - answer_length: letter count of the answer (spaces excluded)
+    # - first_seen_id / last_seen_id: lowest / highest CROSSWORD_CLUES.id carrying the answer
+    create_answer_stats_query = '''CREATE TABLE IF NOT EXISTS ANSWER_STATS \
+    ( \
+        answer VARCHAR(255) NOT NULL PRIMARY KEY, \
+        clue_count INT NOT NULL,
+        answer_length INT NOT NULL,
+        first_seen_id INT NOT NULL,
+        last_seen_id INT NOT NULL,
+        KEY idx_clue_count (clue_count),
+        KEY idx_answer_length (answer_length),
+        KEY idx_last_seen_id (last_seen_id)
+        )'''
+
+    cursor.execute(create_answer_stats_query)
+
+    # Normalized (lowercased, trimmed) definition -> candidate answer with frequency
+    create_definition_answers_query = '''CREATE TABLE IF NOT EXISTS DEFINITION_ANSWERS \
+    ( \
+        definition VARCHAR(255) NOT NULL, \
+        answer VARCHAR(255) NOT NULL,
+        frequency INT NOT NULL,
+        PRIMARY KEY (definition, answer)
+        )'''
+
+    cursor.execute(create_definition_answers_query)
     conn.commit()
 
     # Clean up database resources
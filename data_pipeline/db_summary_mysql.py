@@ -0,0 +1,85 @@
+import mysql.connector
+from .db_mysql_initialize import get_mysql_connection
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def update_summary_tables():
+    """
+    Incrementally maintains the ANSWER_STATS and DEFINITION_ANSWERS summary tables
+    from the CROSSWORD_CLUES rows inserted since the last run.
+
+    The delta is the id range (low, high], where low is the highest CROSSWORD_CLUES.id
+    already folded into ANSWER_STATS (MAX(last_seen_id)) and high is the current
+    MAX(id) of CROSSWORD_CLUES. Only that range is aggregated and merged into the
+    summary tables, so the work per run scales with the new rows rather than the
+    whole table. On a fresh summary table the first run backfills every existing row.
+
+    Process:
+    1. Reads the low / high id watermarks
+    2. Merges aggregated delta counts into ANSWER_STATS
+    3. Merges aggregated delta counts into DEFINITION_ANSWERS
+    4. Commits both updates as a single transaction so the tables stay consistent
+    """
+    mysql_db = None
+    try:
+        # Establish connection to MySQL database
+        logger.info("Establishing database connection")
+        mysql_db = get_mysql_connection()
+        cursor = mysql_db.cursor()
+
+        # Indexed MAX lookups (idx_last_seen_id / primary key) - no table scan
+        cursor.execute("SELECT COALESCE(MAX(last_seen_id), 0) FROM ANSWER_STATS")
+        low_id = cursor.fetchone()[0]
+        cursor.execute("SELECT COALESCE(MAX(id), 0) FROM CROSSWORD_CLUES")
+        high_id = cursor.fetchone()[0]
+
+        if high_id <= low_id:
+            logger.info("Summary tables are up to date, no new rows to aggregate")
+            return
+
+        logger.info(f"Aggregating CROSSWORD_CLUES rows with id in ({low_id}, {high_id}]")
+
+        # Merge per-answer counts; existing rows are incremented, new answers inserted
+        answer_stats_query = '''INSERT INTO ANSWER_STATS \
+        (answer, clue_count, answer_length, first_seen_id, last_seen_id) \
+        SELECT answer, COUNT(*), CHAR_LENGTH(REPLACE(answer, ' ', '')), MIN(id), MAX(id) \
+        FROM CROSSWORD_CLUES \
+        WHERE id > %s AND id <= %s \
+        GROUP BY answer \
+        ON DUPLICATE KEY UPDATE \
+            clue_count = clue_count + VALUES(clue_count), \
+            first_seen_id = LEAST(first_seen_id, VALUES(first_seen_id)), \
+            last_seen_id = GREATEST(last_seen_id, VALUES(last_seen_id));'''
+        cursor.execute(answer_stats_query, (low_id, high_id))
+        logger.info(f"Merged delta into ANSWER_STATS ({cursor.rowcount} rows affected)")
+
+        # Merge normalized definition -> answer frequencies
+        definition_answers_query = '''INSERT INTO DEFINITION_ANSWERS \
+        (definition, answer, frequency) \
+        SELECT LEFT(LOWER(TRIM(definition)), 255) AS norm_definition, answer, COUNT(*) \
+        FROM CROSSWORD_CLUES \
+        WHERE id > %s AND id <= %s \
+        GROUP BY norm_definition, answer \
+        ON DUPLICATE KEY UPDATE \
+            frequency = frequency + VALUES(frequency);'''
+        cursor.execute(definition_answers_query, (low_id, high_id))
+        logger.info(f"Merged delta into DEFINITION_ANSWERS ({cursor.rowcount} rows affected)")
+
+        # Commit both merges together so ANSWER_STATS' watermark never runs ahead
+        mysql_db.commit()
+        logger.info("Summary tables updated successfully")
+
+    except mysql.connector.Error as err:
+        # Roll back partial merges; the next run will pick up the same delta again
+        logger.error("Error: %s" % err)
+        if mysql_db is not None and mysql_db.is_connected():
+            mysql_db.rollback()
+
+    finally:
+        # Always clean up database resources, even if errors occurred
+        if mysql_db is not None and mysql_db.is_connected():
+            cursor.close()
+            mysql_db.close()
+            logger.info("MySQL database connection closed")
@@ -3,6 +3,7 @@ import logging
 
 from .download_crossword_data import download_cryptics_dataset, cleaning_cryptic_data
 from .db_upload_mysql import upload_dataset_mysql
+from .db_summary_mysql import update_summary_tables
 from .config.config import CLEAN_FILE, ENV, LOG_FILE, LOG_LEVEL
 import json
 
@@ -26,6 +27,7 @@ def main():
     1. EXTRACT: Download raw data from API
     2. TRANSFORM: Clean and validate the data
     3. LOAD: Initialize database and upload cleaned data
+    4. SUMMARIZE: Fold newly inserted rows into the summary tables
 
     This ETL (Extract, Transform, Load) pipeline ensures data flows from
     source to database in a structured, repeatable manner.
@@ -59,6 +61,10 @@ def main():
         # Upload all cleaned records to the MySQL database
         upload_dataset_mysql(values)
 
+        # ========== STAGE 4: SUMMARIZE ==========
+        logger.info('Stage 4: Updating answer summary tables')
+        # Incrementally merge the newly inserted rows into ANSWER_STATS and DEFINITION_ANSWERS
+        update_summary_tables()
 
     except FileNotFoundError as f:
         logger.error(f'File not found: {f}')